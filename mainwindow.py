@@ -1,8 +1,9 @@
 # This Python file uses the following encoding: utf-8
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QCoreApplication, QT_TRANSLATE_NOOP, Qt
 from PySide6.QtGui import QClipboard
 from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
 # from opencc_rs_cython import OpenCC  # local package opencc_rs
@@ -14,12 +15,33 @@ from opencc_rs import OpenCC
 #     pyside2-uic form.ui -o ui_form.py
 from ui_form import Ui_MainWindow
 
+MANUAL_CONFIGS = (
+    QT_TRANSLATE_NOOP("MainWindow", "s2t (简 -> 繁)"),
+    QT_TRANSLATE_NOOP("MainWindow", "s2tw (简 -> 繁/台)"),
+    QT_TRANSLATE_NOOP("MainWindow", "s2twp (简 -> 繁/台/惯)"),
+    QT_TRANSLATE_NOOP("MainWindow", "s2hk (简 -> 繁/港)"),
+    QT_TRANSLATE_NOOP("MainWindow", "t2s (繁 -> 简)"),
+    QT_TRANSLATE_NOOP("MainWindow", "t2tw (繁 -> 繁/台)"),
+    QT_TRANSLATE_NOOP("MainWindow", "t2twp (繁 -> 繁/台/惯)"),
+    QT_TRANSLATE_NOOP("MainWindow", "t2hk (繁 -> 繁/港)"),
+    QT_TRANSLATE_NOOP("MainWindow", "tw2s (繁/台 -> 简)"),
+    QT_TRANSLATE_NOOP("MainWindow", "tw2sp (繁/台 -> 简/惯)"),
+    QT_TRANSLATE_NOOP("MainWindow", "tw2t (繁/台 -> 繁)"),
+    QT_TRANSLATE_NOOP("MainWindow", "tw2tp (繁/台 -> 繁/惯)"),
+    QT_TRANSLATE_NOOP("MainWindow", "hk2s (繁/港 -> 简)"),
+    QT_TRANSLATE_NOOP("MainWindow", "hk2t (繁/港 -> 繁)"),
+    QT_TRANSLATE_NOOP("MainWindow", "jp2t (日/新 -> 日/旧)"),
+    QT_TRANSLATE_NOOP("MainWindow", "t2jp (日/旧 -> 日/新)"),
+)
+
 
 class MainWindow(QMainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self.ui.cbManual.addItems([QCoreApplication.translate("MainWindow", label) for label in MANUAL_CONFIGS])
+        self.converter = OpenCC()
 
         self.ui.tabWidget.setCurrentIndex(0)
         self.ui.btnCopy.clicked.connect(self.btn_copy_click)
@@ -66,7 +88,7 @@ class MainWindow(QMainWindow):
     def detect_source_text_info(self):
         text = self.ui.tbSource.toPlainText()
         if text:
-            self.update_source_code(get_text_code(text))
+            self.update_source_code(self.converter.zho_check(text))
             self.ui.lblFilename.setText(os.path.basename(self.ui.tbSource.content_filename))
         if self.ui.tbSource.content_filename:
             self.statusBar().showMessage(f"File: {self.ui.tbSource.content_filename}")
@@ -141,7 +163,8 @@ class MainWindow(QMainWindow):
 
     def btn_process_click(self):
         config = self.get_current_config()
-        converter = OpenCC(config)
+        converter = self.converter
+        converter.config = config
 
         if self.ui.tabWidget.currentIndex() == 0:
             self.ui.tbDestination.clear()
@@ -179,26 +202,19 @@ class MainWindow(QMainWindow):
                 self.ui.statusbar.showMessage("Invalid output directory.")
             else:
                 self.ui.tbPreview.clear()
-                for index in range(self.ui.listSource.count()):
-                    file_path: str = self.ui.listSource.item(index).text()
-                    if os.path.exists(file_path):
-                        try:
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                input_text = f.read()
-                        except UnicodeDecodeError:
-                            input_text = ""
-
-                        if input_text:
-                            converted_text = converter.convert(input_text, self.ui.cbPunct.isChecked())
-
-                            output_filename = self.ui.lineEditDir.text() + "/" + os.path.basename(file_path)
-                            with open(output_filename, "w", encoding="utf-8") as f:
-                                f.write(converted_text)
-                            self.ui.tbPreview.appendPlainText(f"{index + 1}: {output_filename} --> Done.")
-                        else:
-                            self.ui.tbPreview.appendPlainText(f"{index + 1}: {file_path} --> Skip: Not text file.")
-                    else:
-                        self.ui.tbPreview.appendPlainText(f"{index + 1}: {file_path} --> File not found.")
+                file_paths = [self.ui.listSource.item(index).text() for index in range(self.ui.listSource.count())]
+                punctuation = self.ui.cbPunct.isChecked()
+                # Same-named files share an output file, so each group is converted in order
+                groups = {}
+                for path in file_paths:
+                    groups.setdefault(os.path.normcase(os.path.basename(path)), []).append(path)
+                with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                    group_results = executor.map(lambda paths: convert_files(converter, paths, out_dir, punctuation),
+                                                 groups.values())
+                    results = dict(zip((path for paths in groups.values() for path in paths),
+                                       (result for group in group_results for result in group)))
+                for index, path in enumerate(file_paths):
+                    self.ui.tbPreview.appendPlainText(f"{index + 1}: {results[path]}")
                 self.ui.statusbar.showMessage("Process completed")
 
     def update_source_code(self, text_code):
@@ -298,8 +314,37 @@ class MainWindow(QMainWindow):
 def btn_exit_click():
     QApplication.quit()
 
-def get_text_code(text):
-    return OpenCC().zho_check(text)
+
+def convert_files(converter, file_paths, out_dir, punctuation):
+    return [convert_file(converter, file_path, out_dir, punctuation) for file_path in file_paths]
+
+
+def convert_file(converter, file_path, out_dir, punctuation):
+    if not os.path.exists(file_path):
+        return f"{file_path} --> File not found."
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            input_text = f.read()
+    except UnicodeDecodeError:
+        input_text = ""
+    except OSError as e:
+        return f"{file_path} --> Error: {e}"
+
+    if not input_text:
+        return f"{file_path} --> Skip: Not text file."
+
+    try:
+        converted_text = converter.convert(input_text, punctuation)
+    except RuntimeError as e:
+        return f"{file_path} --> Error: {e}"
+
+    output_filename = out_dir + "/" + os.path.basename(file_path)
+    try:
+        with open(output_filename, "w", encoding="utf-8") as f:
+            f.write(converted_text)
+    except OSError as e:
+        return f"{output_filename} --> Error: {e}"
+    return f"{output_filename} --> Done."
 
 
 if __name__ == "__main__":
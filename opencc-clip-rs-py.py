@@ -2,7 +2,7 @@ import platform
 import sys
 
 # import pyperclip as pc
-from opencc_rs import OpenCC
+from opencc_rs import OpenCC, CONFIG_SET
 
 if platform.system() == 'Windows':
     from clipboard_win import get_clipboard_text, set_clipboard_text
@@ -19,12 +19,10 @@ RESET = "\033[0m"
 
 
 def main():
-    config_list = ["s2t", "t2s", "s2tw", "tw2s", "s2twp", "tw2sp", "s2hk", "hk2s", "t2tw", "tw2t", "t2twp", "tw2t",
-                   "tw2tp", "t2hk", "hk2t", "t2jp", "jp2t"]
     config = "auto"
     punctuation = False
     if len(sys.argv) > 1:
-        if sys.argv[1].lower() not in config_list:
+        if sys.argv[1].lower() not in CONFIG_SET:
             config = "auto"
         else:
             config = sys.argv[1].lower()
@@ -55,10 +53,11 @@ def main():
         print(f"{RED}Clipboard is empty{RESET}")
         return
 
+    converter = OpenCC()
     auto_detect = ""
     if config == "auto":
         auto_detect = " (auto)"
-        text_code = OpenCC().zho_check(input_text)
+        text_code = converter.zho_check(input_text)
         if text_code == 1:
             config = "t2s"
             display_input_code = "Traditional 繁体"
@@ -73,7 +72,7 @@ def main():
             display_output_code = "Others 其它"
 
     # Initialized conversion config
-    converter = OpenCC(config)
+    converter.config = config
     # Do conversion
     output_text = converter.convert(input_text, punctuation)
 
@@ -3,4 +3,4 @@
 # GitHub:
 # January, 2024
 ##########################################################
-from .opencc_rs import OpenCC
+from .opencc_rs import OpenCC, CONFIG_SET
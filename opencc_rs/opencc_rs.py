@@ -1,6 +1,8 @@
 import ctypes
 import os
 import platform
+import threading
+from collections import OrderedDict
 
 # Determine the DLL file based on the operating system
 if platform.system() == 'Windows':
@@ -12,15 +14,38 @@ elif platform.system() == 'Linux':
 else:
     raise OSError("Unsupported operating system")
 
-CONFIG_LIST = [
-    "s2t", "t2s", "s2tw", "tw2s", "s2twp", "tw2sp", "s2hk", "hk2s", "t2tw", "tw2t", "t2twp", "tw2t", "tw2tp",
+CONFIG_SET = frozenset({
+    "s2t", "t2s", "s2tw", "tw2s", "s2twp", "tw2sp", "s2hk", "hk2s", "t2tw", "tw2t", "t2twp", "tw2tp",
     "t2hk", "hk2t", "t2jp", "jp2t"
-]
+})
+
+CACHE_SIZE = 4096
+CACHE_MAX_TEXT_LENGTH = 1024
+
+# ASCII record separator, unchanged by every config
+BATCH_SEPARATOR = "\x1e"
 
 
 class OpenCC:
     def __init__(self, config=None):
-        self.config = config if config in CONFIG_LIST else "s2t"
+        self.config = config
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._handle = self.lib.opencc_new()
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, value):
+        self._config = value if value in CONFIG_SET else "s2t"
+        self._config_bytes = self._config.encode('utf-8')
+
+    def __del__(self):
+        if getattr(self, '_handle', None):
+            self.lib.opencc_free(self._handle)
+            self._handle = None
 
     # Load the DLL
     dll_path = os.path.join(os.path.dirname(__file__), DLL_FILE)
@@ -28,22 +53,61 @@ class OpenCC:
     # Define function prototypes
     lib.opencc_new.restype = ctypes.c_void_p
     lib.opencc_new.argtypes = []
-    lib.opencc_convert.restype = ctypes.c_char_p
+    lib.opencc_convert.restype = ctypes.c_void_p
     lib.opencc_convert.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_bool]
     lib.opencc_zho_check.restype = ctypes.c_int
     lib.opencc_zho_check.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
     lib.opencc_free.argtypes = [ctypes.c_void_p]
+    lib.opencc_string_free.argtypes = [ctypes.c_void_p]
+    lib.opencc_last_error.restype = ctypes.c_void_p
+    lib.opencc_last_error.argtypes = []
 
     def convert(self, text, punctuation=False):
-        opencc = self.lib.opencc_new()
-        if opencc is None:
+        if text.isascii():
             return text
-        result = self.lib.opencc_convert(opencc, text.encode('utf-8'), self.config.encode('utf-8'), punctuation)
-        self.lib.opencc_free(opencc)
-        return result.decode('utf-8')
+        if len(text) > CACHE_MAX_TEXT_LENGTH:
+            return self._convert(text, self._config_bytes, punctuation)
+        key = (text, self._config_bytes, punctuation)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+        result = self._convert(*key)
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def convert_batch(self, texts, punctuation=False):
+        texts = list(texts)
+        if not texts:
+            return []
+        if any(BATCH_SEPARATOR in text for text in texts):
+            return [self.convert(text, punctuation) for text in texts]
+        return self.convert(BATCH_SEPARATOR.join(texts), punctuation).split(BATCH_SEPARATOR)
+
+    def _convert(self, text, config_bytes, punctuation):
+        if self._handle is None:
+            return text
+        result = self.lib.opencc_convert(self._handle, text.encode('utf-8'), config_bytes, punctuation)
+        if result is None:
+            raise RuntimeError(f"opencc_convert failed: {self._last_error()}")
+        # The result buffer is owned by the library
+        try:
+            return ctypes.string_at(result).decode('utf-8')
+        finally:
+            self.lib.opencc_string_free(result)
+
+    def _last_error(self):
+        error = self.lib.opencc_last_error()
+        if error is None:
+            return "unknown error"
+        try:
+            return ctypes.string_at(error).decode('utf-8', 'replace')
+        finally:
+            self.lib.opencc_string_free(error)
 
     def zho_check(self, text):
-        opencc = self.lib.opencc_new()
-        code = self.lib.opencc_zho_check(opencc, text.encode('utf-8'))
-        self.lib.opencc_free(opencc)
-        return code
+        return self.lib.opencc_zho_check(self._handle, text.encode('utf-8'))
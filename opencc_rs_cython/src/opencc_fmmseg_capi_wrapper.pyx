@@ -1,6 +1,6 @@
 # opencc_fmmseg_capi_wrapper.pyx
 
-cdef extern from "opencc_fmmseg_capi.h":
+cdef extern from "opencc_fmmseg_capi.h" nogil:
     void *opencc_new()
     char *opencc_convert(const void *instance, const char *input_text, const char *config, bint punctuation)
     bint opencc_get_parallel(const void *instance)
@@ -10,10 +10,19 @@ cdef extern from "opencc_fmmseg_capi.h":
     void opencc_string_free(const char *ptr)
     char *opencc_last_error()
 
-CONFIG_LIST = [
+CONFIG_SET = frozenset({
     b"s2t", b"t2s", b"s2tw", b"tw2s", b"s2twp", b"tw2sp", b"s2hk", b"hk2s",
-    b"t2tw", b"tw2t", b"t2twp", b"tw2t", b"tw2tp", b"t2hk", b"hk2t", b"t2jp", b"jp2t"
-]
+    b"t2tw", b"tw2t", b"t2twp", b"tw2tp", b"t2hk", b"hk2t", b"t2jp", b"jp2t"
+})
+
+cdef str _last_error():
+    cdef char *error = opencc_last_error()
+    if error is NULL:
+        return "unknown error"
+    try:
+        return error.decode('utf-8', 'replace')
+    finally:
+        opencc_string_free(error)
 
 cdef class OpenCC:
     cdef void *ptr
@@ -30,7 +39,7 @@ cdef class OpenCC:
         def __set__(self, value):
             if isinstance(value, str):
                 value = value.encode('utf-8')
-            if value not in CONFIG_LIST:
+            if value not in CONFIG_SET:
                 value = b's2t'
             self._config = value
 
@@ -42,15 +51,19 @@ cdef class OpenCC:
     def convert(self, input_text, punctuation=True):
         input_bytes = input_text.encode('utf-8')
         config_bytes = self.config
-        cdef char *result = opencc_convert(self.ptr, input_bytes, config_bytes, punctuation)
+        cdef const char *c_input = input_bytes
+        cdef const char *c_config = config_bytes
+        cdef bint c_punctuation = punctuation
+        cdef char *result
+        # Let other Python threads run while the native conversion is in progress
+        with nogil:
+            result = opencc_convert(self.ptr, c_input, c_config, c_punctuation)
+        if result is NULL:
+            raise RuntimeError(f"opencc_convert failed: {_last_error()}")
         try:
-            if result is not NULL:
-                return result.decode('utf-8')
-            else:
-                return ""
+            return result.decode('utf-8')
         finally:
-            if result is not NULL:
-                opencc_string_free(result)
+            opencc_string_free(result)
 
     def get_parallel(self):
         return opencc_get_parallel(self.ptr)
@@ -60,7 +73,11 @@ cdef class OpenCC:
 
     def zho_check(self, input_text):
         input_bytes = input_text.encode('utf-8')
-        return opencc_zho_check(self.ptr, input_bytes)
+        cdef const char *c_input = input_bytes
+        cdef int code
+        with nogil:
+            code = opencc_zho_check(self.ptr, c_input)
+        return code
 
     def last_error(self):
-        return opencc_last_error().decode('utf-8')
+        return _last_error()
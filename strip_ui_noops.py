@@ -0,0 +1,83 @@
+import ast
+import sys
+from pathlib import Path
+
+# Setter calls emitted by pyside6-uic that only re-apply the Qt default value
+NOOP_CALLS = {
+    "setMidLineWidth": (0,),
+    "setLineWidth": (1,),
+    "setHorizontalStretch": (0,),
+    "setVerticalStretch": (0,),
+}
+
+
+# Widgets whose freshly constructed size policy never has height-for-width set
+NO_HEIGHT_FOR_WIDTH_CLASSES = frozenset({"QLabel", "QPushButton"})
+
+
+def get_widget_classes(tree):
+    # self.name = QClass(...) assignments in setupUi
+    classes = {}
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Attribute) and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)):
+            classes[node.targets[0].attr] = node.value.func.id
+    return classes
+
+
+def is_height_for_width_copy(call, widget_classes):
+    # sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+    if call.func.attr != "setHeightForWidth" or len(call.args) != 1:
+        return False
+    arg = call.args[0]
+    if not (isinstance(arg, ast.Call) and isinstance(arg.func, ast.Attribute)
+            and arg.func.attr == "hasHeightForWidth" and not arg.args
+            and isinstance(arg.func.value, ast.Call) and isinstance(arg.func.value.func, ast.Attribute)
+            and arg.func.value.func.attr == "sizePolicy"):
+        return False
+    widget = arg.func.value.func.value
+    return (isinstance(widget, ast.Attribute)
+            and widget_classes.get(widget.attr) in NO_HEIGHT_FOR_WIDTH_CLASSES)
+
+
+def is_noop(call, widget_classes):
+    if not isinstance(call.func, ast.Attribute) or call.keywords:
+        return False
+    if is_height_for_width_copy(call, widget_classes):
+        return True
+    name = call.func.attr
+    if name not in NOOP_CALLS:
+        return False
+    args = call.args
+    return (all(isinstance(arg, ast.Constant) for arg in args)
+            and tuple(arg.value for arg in args) == NOOP_CALLS[name])
+
+
+def strip_noops(file_path):
+    file_path = Path(file_path)
+    source = file_path.read_bytes().decode("utf-8")
+    lines = source.split("\n")
+
+    tree = ast.parse(source)
+    widget_classes = get_widget_classes(tree)
+
+    # Only whole statements are removed, so the rest of the generated formatting is kept as is
+    drop = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call) and is_noop(node.value, widget_classes):
+            drop.update(range(node.lineno - 1, node.end_lineno))
+
+    if drop:
+        kept = "\n".join(line for i, line in enumerate(lines) if i not in drop)
+        file_path.write_bytes(kept.encode("utf-8"))
+    return len(drop)
+
+
+def main():
+    for file_path in sys.argv[1:] or ["ui_form.py"]:
+        print(f"{file_path}: {strip_noops(file_path)} no-op lines removed")
+
+
+if __name__ == "__main__":
+    main()
@@ -71,22 +71,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_config.addWidget(self.rbManual)
 
         self.cbManual = QComboBox(self.centralwidget)
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
-        self.cbManual.addItem("")
         self.cbManual.setObjectName(u"cbManual")
         self.cbManual.setMaximumSize(QSize(180, 16777215))
         font1 = QFont()
@@ -172,7 +156,6 @@ class Ui_MainWindow(object):
         self.tbSource.setObjectName(u"tbSource")
         self.tbSource.setFrameShape(QFrame.Shape.Box)
         self.tbSource.setLineWidth(2)
-        self.tbSource.setMidLineWidth(0)
         self.tbSource.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
         self.horizontalLayout_textBox.addWidget(self.tbSource)
@@ -182,7 +165,6 @@ class Ui_MainWindow(object):
         self.tbDestination.setAcceptDrops(False)
         self.tbDestination.setFrameShape(QFrame.Shape.Box)
         self.tbDestination.setLineWidth(2)
-        self.tbDestination.setMidLineWidth(0)
         self.tbDestination.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.tbDestination.setReadOnly(True)
 
@@ -198,15 +180,11 @@ class Ui_MainWindow(object):
         self.lblSource = QLabel(self.tab_main)
         self.lblSource.setObjectName(u"lblSource")
         sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.lblSource.sizePolicy().hasHeightForWidth())
         self.lblSource.setSizePolicy(sizePolicy)
         self.lblSource.setMinimumSize(QSize(80, 0))
         self.lblSource.setMaximumSize(QSize(80, 16777215))
         self.lblSource.setFont(font2)
         self.lblSource.setFrameShape(QFrame.Shape.StyledPanel)
-        self.lblSource.setLineWidth(1)
         self.lblSource.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.horizontalLayout_source.addWidget(self.lblSource)
@@ -214,9 +192,6 @@ class Ui_MainWindow(object):
         self.lblSourceCode = QLabel(self.tab_main)
         self.lblSourceCode.setObjectName(u"lblSourceCode")
         sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        sizePolicy1.setHorizontalStretch(0)
-        sizePolicy1.setVerticalStretch(0)
-        sizePolicy1.setHeightForWidth(self.lblSourceCode.sizePolicy().hasHeightForWidth())
         self.lblSourceCode.setSizePolicy(sizePolicy1)
         self.lblSourceCode.setFont(font2)
         self.lblSourceCode.setMargin(5)
@@ -225,7 +200,6 @@ class Ui_MainWindow(object):
 
         self.lblCharCount = QLabel(self.tab_main)
         self.lblCharCount.setObjectName(u"lblCharCount")
-        sizePolicy1.setHeightForWidth(self.lblCharCount.sizePolicy().hasHeightForWidth())
         self.lblCharCount.setSizePolicy(sizePolicy1)
         self.lblCharCount.setFont(font2)
 
@@ -233,7 +207,6 @@ class Ui_MainWindow(object):
 
         self.btnDetect = QPushButton(self.tab_main)
         self.btnDetect.setObjectName(u"btnDetect")
-        sizePolicy.setHeightForWidth(self.btnDetect.sizePolicy().hasHeightForWidth())
         self.btnDetect.setSizePolicy(sizePolicy)
         self.btnDetect.setMaximumSize(QSize(30, 16777215))
         font3 = QFont()
@@ -255,7 +228,6 @@ class Ui_MainWindow(object):
 
         self.btnPaste = QPushButton(self.tab_main)
         self.btnPaste.setObjectName(u"btnPaste")
-        sizePolicy.setHeightForWidth(self.btnPaste.sizePolicy().hasHeightForWidth())
         self.btnPaste.setSizePolicy(sizePolicy)
         self.btnPaste.setFont(font2)
 
@@ -268,7 +240,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_deatination.setObjectName(u"horizontalLayout_deatination")
         self.lblDestination = QLabel(self.tab_main)
         self.lblDestination.setObjectName(u"lblDestination")
-        sizePolicy.setHeightForWidth(self.lblDestination.sizePolicy().hasHeightForWidth())
         self.lblDestination.setSizePolicy(sizePolicy)
         self.lblDestination.setMinimumSize(QSize(80, 0))
         self.lblDestination.setMaximumSize(QSize(80, 16777215))
@@ -294,7 +265,6 @@ class Ui_MainWindow(object):
 
         self.btnCopy = QPushButton(self.tab_main)
         self.btnCopy.setObjectName(u"btnCopy")
-        sizePolicy.setHeightForWidth(self.btnCopy.sizePolicy().hasHeightForWidth())
         self.btnCopy.setSizePolicy(sizePolicy)
         self.btnCopy.setFont(font2)
 
@@ -385,9 +355,6 @@ class Ui_MainWindow(object):
         self.label = QLabel(self.tab_batch)
         self.label.setObjectName(u"label")
         sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
-        sizePolicy2.setHorizontalStretch(0)
-        sizePolicy2.setVerticalStretch(0)
-        sizePolicy2.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
         self.label.setSizePolicy(sizePolicy2)
         self.label.setFont(font2)
         self.label.setMargin(1)
@@ -401,7 +368,6 @@ class Ui_MainWindow(object):
 
         self.btnOutDir = QPushButton(self.tab_batch)
         self.btnOutDir.setObjectName(u"btnOutDir")
-        sizePolicy.setHeightForWidth(self.btnOutDir.sizePolicy().hasHeightForWidth())
         self.btnOutDir.setSizePolicy(sizePolicy)
         self.btnOutDir.setMaximumSize(QSize(30, 16777215))
         self.btnOutDir.setFont(font3)
@@ -414,7 +380,6 @@ class Ui_MainWindow(object):
 
         self.btnPreviewClear = QPushButton(self.tab_batch)
         self.btnPreviewClear.setObjectName(u"btnPreviewClear")
-        sizePolicy.setHeightForWidth(self.btnPreviewClear.sizePolicy().hasHeightForWidth())
         self.btnPreviewClear.setSizePolicy(sizePolicy)
         self.btnPreviewClear.setFont(font3)
 
@@ -441,7 +406,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_openFile.setObjectName(u"horizontalLayout_openFile")
         self.btnOpenFile = QPushButton(self.centralwidget)
         self.btnOpenFile.setObjectName(u"btnOpenFile")
-        sizePolicy.setHeightForWidth(self.btnOpenFile.sizePolicy().hasHeightForWidth())
         self.btnOpenFile.setSizePolicy(sizePolicy)
         self.btnOpenFile.setFont(font2)
 
@@ -461,7 +425,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_process.setObjectName(u"horizontalLayout_process")
         self.btnProcess = QPushButton(self.centralwidget)
         self.btnProcess.setObjectName(u"btnProcess")
-        sizePolicy.setHeightForWidth(self.btnProcess.sizePolicy().hasHeightForWidth())
         self.btnProcess.setSizePolicy(sizePolicy)
         self.btnProcess.setMinimumSize(QSize(110, 0))
         font5 = QFont()
@@ -486,7 +449,6 @@ class Ui_MainWindow(object):
 
         self.btnSaveAs = QPushButton(self.centralwidget)
         self.btnSaveAs.setObjectName(u"btnSaveAs")
-        sizePolicy.setHeightForWidth(self.btnSaveAs.sizePolicy().hasHeightForWidth())
         self.btnSaveAs.setSizePolicy(sizePolicy)
         self.btnSaveAs.setFont(font2)
 
@@ -494,7 +456,6 @@ class Ui_MainWindow(object):
 
         self.btnExit = QPushButton(self.centralwidget)
         self.btnExit.setObjectName(u"btnExit")
-        sizePolicy.setHeightForWidth(self.btnExit.sizePolicy().hasHeightForWidth())
         self.btnExit.setSizePolicy(sizePolicy)
         self.btnExit.setFont(font2)
 
@@ -531,11 +492,9 @@ class Ui_MainWindow(object):
 
         self.retranslateUi(MainWindow)
 
-        self.cbManual.setCurrentIndex(0)
         self.tabWidget.setCurrentIndex(0)
 
 
-        QMetaObject.connectSlotsByName(MainWindow)
     # setupUi
 
     def retranslateUi(self, MainWindow):
@@ -545,23 +504,6 @@ class Ui_MainWindow(object):
         self.rbS2t.setText(QCoreApplication.translate("MainWindow", u"zh-Hans \uff08\u7b80\uff09 To zh-Hant \uff08\u7e41\uff09", None))
         self.rbT2s.setText(QCoreApplication.translate("MainWindow", u"zh-Hant \uff08\u7e41\uff09 To zh-Hans \uff08\u7b80\uff09", None))
         self.rbManual.setText(QCoreApplication.translate("MainWindow", u"Manual (\u81ea\u5b9a\u4e49) :", None))
-        self.cbManual.setItemText(0, QCoreApplication.translate("MainWindow", u"s2t (\u7b80 -> \u7e41)", None))
-        self.cbManual.setItemText(1, QCoreApplication.translate("MainWindow", u"s2tw (\u7b80 -> \u7e41/\u53f0)", None))
-        self.cbManual.setItemText(2, QCoreApplication.translate("MainWindow", u"s2twp (\u7b80 -> \u7e41/\u53f0/\u60ef)", None))
-        self.cbManual.setItemText(3, QCoreApplication.translate("MainWindow", u"s2hk (\u7b80 -> \u7e41/\u6e2f)", None))
-        self.cbManual.setItemText(4, QCoreApplication.translate("MainWindow", u"t2s (\u7e41 -> \u7b80)", None))
-        self.cbManual.setItemText(5, QCoreApplication.translate("MainWindow", u"t2tw (\u7e41 -> \u7e41/\u53f0)", None))
-        self.cbManual.setItemText(6, QCoreApplication.translate("MainWindow", u"t2twp (\u7e41 -> \u7e41/\u53f0/\u60ef)", None))
-        self.cbManual.setItemText(7, QCoreApplication.translate("MainWindow", u"t2hk (\u7e41 -> \u7e41/\u6e2f)", None))
-        self.cbManual.setItemText(8, QCoreApplication.translate("MainWindow", u"tw2s (\u7e41/\u53f0 -> \u7b80)", None))
-        self.cbManual.setItemText(9, QCoreApplication.translate("MainWindow", u"tw2sp (\u7e41/\u53f0 -> \u7b80/\u60ef)", None))
-        self.cbManual.setItemText(10, QCoreApplication.translate("MainWindow", u"tw2t (\u7e41/\u53f0 -> \u7e41)", None))
-        self.cbManual.setItemText(11, QCoreApplication.translate("MainWindow", u"tw2tp (\u7e41/\u53f0 -> \u7e41/\u60ef)", None))
-        self.cbManual.setItemText(12, QCoreApplication.translate("MainWindow", u"hk2s (\u7e41/\u6e2f -> \u7b80)", None))
-        self.cbManual.setItemText(13, QCoreApplication.translate("MainWindow", u"hk2t (\u7e41/\u6e2f -> \u7e41)", None))
-        self.cbManual.setItemText(14, QCoreApplication.translate("MainWindow", u"jp2t (\u65e5/\u65b0 -> \u65e5/\u65e7)", None))
-        self.cbManual.setItemText(15, QCoreApplication.translate("MainWindow", u"t2jp (\u65e5/\u65e7 -> \u65e5/\u65b0)", None))
-
         self.rbStd.setText(QCoreApplication.translate("MainWindow", u"Standard \uff08\u6807\u51c6\u7b80\u7e41\uff09", None))
         self.rbZhTw.setText(QCoreApplication.translate("MainWindow", u"ZH/TW \uff08\u4e2d\u53f0\u7b80\u7e41\uff09", None))
         self.rbHK.setText(QCoreApplication.translate("MainWindow", u"Hong Kong \uff08\u9999\u6e2f\u7b80\u7e41\uff09", None))
@@ -1,72 +1,354 @@
+import argparse
+import functools
+import hashlib
+import json
 import os
-import subprocess
+import sys
 from pathlib import Path
-from datetime import datetime
 
-RED = "\033[1;31m"
-GREEN = "\033[1;32m"
-YELLOW = "\033[1;33m"
-BLUE = "\033[1;34m"
-RESET = "\033[0m"
 
+def colorizer(code):
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+        return str
+    prefix = f"\033[1;{code}m"
+    return lambda text: f"{prefix}{text}\033[0m"
 
-def get_last_write_time(file_path):
-    return datetime.fromtimestamp(file_path.stat().st_mtime)
 
+red = colorizer(31)
+green = colorizer(32)
+yellow = colorizer(33)
+blue = colorizer(34)
 
-def format_datetime(dt):
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+# Source digests from the last successful build
+CACHE_FILE = ".uic_cache.json"
+
+UIC_ARGS = ["--no-autoconnection"]
+RCC_ARGS = []
+
+# Seconds between polls in watch mode
+WATCH_INTERVAL = 0.5
+
+
+SOURCE_SUFFIXES = (".ui", ".qrc")
+BUILD_SUFFIXES = SOURCE_SUFFIXES + (".py",)
+
+
+def scan_build_files(directory):
+    with os.scandir(directory) as entries:
+        return {entry.name: entry.stat() for entry in entries
+                if entry.name.endswith(BUILD_SUFFIXES) and entry.is_file()}
+
+
+def get_sources(build_stats):
+    return sorted(name for name in build_stats if name.endswith(SOURCE_SUFFIXES))
+
+
+def get_output_name(source_name):
+    stem, suffix = os.path.splitext(source_name)
+    return f"ui_{stem}.py" if suffix == ".ui" else f"{stem}_rc.py"
+
+
+def get_last_write_time(file_stat):
+    return file_stat.st_mtime
+
+
+def format_datetime(timestamp):
+    from datetime import datetime
+
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def file_digest(file_path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_qt_version():
+    from importlib import metadata
+
+    for distribution in ("PySide6-Essentials", "PySide6"):
+        try:
+            return metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            pass
+
+    import subprocess
+
+    try:
+        result = subprocess.run(["pyside6-uic", "--version"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return ""
+    return result.stdout.strip()
+
+
+def get_generator_fingerprint(script_root):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([UIC_ARGS, RCC_ARGS]).encode("utf-8"))
+    digest.update(file_digest(script_root / "strip_ui_noops.py").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def run_qt_tool(tool, args):
+    try:
+        from PySide6.scripts.pyside_tool import qt_tool_wrapper
+    except ImportError:
+        import subprocess
+
+        try:
+            return subprocess.run([f"pyside6-{tool}"] + args).returncode
+        except OSError:
+            return 127
+    try:
+        qt_tool_wrapper(tool, ["-g", "python"] + args, True)
+    except SystemExit as e:
+        return e.code or 0
+    except OSError:
+        return 127
+    return 0
+
+
+def load_cache(cache_path):
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(cache_path, cache):
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def needs_rebuild(cache, source_name, source_digest, output_stat):
+    return output_stat is None or cache.get(source_name) != source_digest
+
+
+def replace_if_changed(tmp_path, output_path):
+    try:
+        unchanged = output_path.read_bytes() == tmp_path.read_bytes()
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        tmp_path.unlink()
+        return False
+    os.replace(tmp_path, output_path)
+    return True
+
+
+# Build functions return None on failure, otherwise whether the output changed
+def build_ui_module(ui_path, output_name):
+    import compileall
+
+    from strip_ui_noops import strip_noops
+
+    output_path = Path(output_name)
+    tmp_path = Path(output_name + ".tmp")
+    if run_qt_tool("uic", UIC_ARGS + [str(ui_path), "-o", str(tmp_path)]) != 0:
+        tmp_path.unlink(missing_ok=True)
+        return None
+    strip_noops(tmp_path)
+    if not replace_if_changed(tmp_path, output_path):
+        return False
+    compileall.compile_file(str(output_path), quiet=1)
+    return True
+
+
+def build_resource_module(qrc_path, output_name):
+    import compileall
+
+    output_path = Path(output_name)
+    tmp_path = Path(output_name + ".tmp")
+    if run_qt_tool("rcc", RCC_ARGS + [str(qrc_path), "-o", str(tmp_path)]) != 0:
+        tmp_path.unlink(missing_ok=True)
+        return None
+    if not replace_if_changed(tmp_path, output_path):
+        return False
+    compileall.compile_file(str(output_path), quiet=1)
+    return True
+
+
+SOURCE_BUILDERS = {".ui": build_ui_module, ".qrc": build_resource_module}
+
+
+def print_source_status(source_name, output_name, source_stat, output_stat, is_changed):
+    name_width = max(len(source_name), len(output_name))
+    print(f"{source_name:<{name_width}}: {format_datetime(get_last_write_time(source_stat))}")
+    if output_stat is not None:
+        print(f"{output_name:<{name_width}}: {format_datetime(get_last_write_time(output_stat))}")
+    else:
+        print(f"{output_name:<{name_width}}: not found")
+
+    print(f"{source_name} changed since last build : ", end="")
+    if is_changed:
+        print(green(is_changed))
+    else:
+        print(red(is_changed))
+        print(blue(f"No {output_name} update needed."))
+
+
+def update_generated_files(script_root, verbose=True):
+    cache_path = script_root / CACHE_FILE
+    cache = load_cache(cache_path)
+    qt_version = get_qt_version()
+    generator = get_generator_fingerprint(script_root)
+    if cache.get("qt_version") != qt_version or cache.get("generator") != generator:
+        cache = {"qt_version": qt_version, "generator": generator}
+
+    build_stats = scan_build_files(script_root)
+    sources = get_sources(build_stats)
+    summary = {}
+    if not sources:
+        if verbose:
+            print("No .ui or .qrc files found.")
+        return summary
+
+    jobs = []
+    for source_name in sources:
+        output_name = get_output_name(source_name)
+        output_stat = build_stats.get(output_name)
+        source_path = script_root / source_name
+        digest = file_digest(source_path)
+        is_changed = needs_rebuild(cache, source_name, digest, output_stat)
+        summary[source_name] = {
+            "output": output_name,
+            "source_mtime": get_last_write_time(build_stats[source_name]),
+            "output_mtime": get_last_write_time(output_stat) if output_stat is not None else None,
+            "result": "up to date",
+        }
+        if verbose:
+            print_source_status(source_name, output_name, build_stats[source_name], output_stat, is_changed)
+        if is_changed:
+            build = SOURCE_BUILDERS[source_path.suffix]
+            jobs.append((source_name, output_name, functools.partial(build, source_path, output_name), digest))
+
+    if not jobs:
+        return summary
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(lambda job: job[2](), jobs))
+
+    for (source_name, output_name, _, digest), changed in zip(jobs, results):
+        if changed is None:
+            summary[source_name]["result"] = "failed"
+            if verbose:
+                print(red(f"{output_name} generation failed."))
+            continue
+        cache[source_name] = digest
+        summary[source_name]["result"] = "updated" if changed else "unchanged"
+        if verbose:
+            if changed:
+                print(blue(f"{output_name} updated."))
+            else:
+                print(blue(f"{output_name} regenerated, content unchanged."))
+
+    if any(changed is not None for changed in results):
+        save_cache(cache_path, cache)
+    return summary
+
+
+def get_source_mtimes(script_root):
+    build_stats = scan_build_files(script_root)
+    return {name: build_stats[name].st_mtime_ns for name in get_sources(build_stats)}
+
+
+def watch_polling(script_root, update):
+    import time
+
+    last_mtimes = get_source_mtimes(script_root)
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        mtimes = get_source_mtimes(script_root)
+        if mtimes != last_mtimes:
+            last_mtimes = mtimes
+            update()
+
+
+def load_watchdog():
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+    return FileSystemEventHandler, Observer
+
+
+def watch_events(script_root, update, FileSystemEventHandler, Observer):
+    import queue
+    import time
+
+    changes = queue.Queue()
+
+    class SourceChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Reading the sources raises open/close events too
+            if event.event_type not in ("created", "modified", "moved"):
+                return
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(path.endswith(SOURCE_SUFFIXES) for path in paths):
+                changes.put(event)
+
+    observer = Observer()
+    observer.schedule(SourceChangeHandler(), str(script_root))
+    observer.start()
+    try:
+        while True:
+            try:
+                changes.get(timeout=WATCH_INTERVAL)
+            except queue.Empty:
+                continue
+            time.sleep(WATCH_INTERVAL)
+            while not changes.empty():
+                changes.get_nowait()
+            update()
+    finally:
+        observer.stop()
+        observer.join()
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Regenerate the Python modules for the .ui and .qrc files next to this script.")
+    parser.add_argument("--watch", action="store_true", help="keep running and regenerate on every change")
+    parser.add_argument("--json", action="store_true", help="print one JSON summary line per update instead of the report")
+    args = parser.parse_args()
+
+    if os.environ.get("ZHOCONVERT_SKIP_UIC") == "1":
+        if args.json:
+            print(json.dumps({"skipped": True, "sources": {}}))
+        else:
+            print("ZHOCONVERT_SKIP_UIC=1, generated files left as they are.")
+        return
+
     # Set the current working directory to the directory where the script is located
     script_root = Path(__file__).parent
     os.chdir(script_root)
 
-    ui_path = script_root / "form.ui"
-    qrc_path = script_root / "resource.qrc"
-
-    if ui_path.exists():
-        file_ui = ui_path
-        last_save_date_ui = get_last_write_time(file_ui)
-        print(f"form.ui   : {format_datetime(last_save_date_ui)}")
+    def update():
+        if args.json:
+            summary = update_generated_files(script_root, verbose=False)
+            print(json.dumps({"skipped": False, "sources": summary}), flush=True)
+        else:
+            update_generated_files(script_root)
 
-        file_ui_py = script_root / "ui_form.py"
-        last_save_date_ui_py = get_last_write_time(file_ui_py)
-        print(f"ui_form.py: {format_datetime(last_save_date_ui_py)}")
+    update()
+    if not args.watch:
+        return
 
-        print("form.ui Newer than ui_form.py : ", end="")
-        is_ui_newer = last_save_date_ui > last_save_date_ui_py
-        if is_ui_newer:
-            print(f"{GREEN}{is_ui_newer}{RESET}")
-            subprocess.run(["pyside6-uic", str(ui_path), "-o", "ui_form.py"])
-            print(f"{BLUE}ui_form.py updated.{RESET}")
-        else:
-            print(f"{RED}{is_ui_newer}{RESET}")
-            print(f"{BLUE}No Ui update needed.{RESET}")
-    else:
-        print("form.ui not found.")
-
-    if qrc_path.exists():
-        file_qrc = qrc_path
-        last_save_date_qrc = get_last_write_time(file_qrc)
-        print(f"resource.qrc  : {format_datetime(last_save_date_qrc)}")
-
-        file_qrc_py = script_root / "resource_rc.py"
-        last_save_date_qrc_py = get_last_write_time(file_qrc_py)
-        print(f"resource_rc.py: {format_datetime(last_save_date_qrc_py)}")
-
-        print("resource.qrc Newer than resource_rc.py : ", end="")
-        is_qrc_newer = last_save_date_qrc > last_save_date_qrc_py
-        if is_qrc_newer:
-            print(f"{GREEN}{is_qrc_newer}{RESET}")
-            subprocess.run(["pyside6-rcc", str(qrc_path), "-o", "resource_rc.py"])
-            print(f"{BLUE}resource_rc.py updated.{RESET}")
+    if not args.json:
+        print(yellow("Watching .ui and .qrc files, press Ctrl+C to stop."))
+    try:
+        watchdog_classes = load_watchdog()
+        if watchdog_classes is not None:
+            watch_events(script_root, update, *watchdog_classes)
         else:
-            print(f"{RED}{is_qrc_newer}{RESET}")
-            print(f"{BLUE}No Qrc update needed.{RESET}")
-    else:
-        print("resource.qrc not found.")
+            watch_polling(script_root, update)
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
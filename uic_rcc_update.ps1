@@ -16,7 +16,8 @@ if (Test-Path -LiteralPath $UiPath)
     if ($IsUiNewer)
     {
         Write-Host $IsUiNewer -ForegroundColor Green
-        & pyside6-uic form.ui -o ui_form.py
+        & pyside6-uic --no-autoconnection form.ui -o ui_form.py
+        & python strip_ui_noops.py ui_form.py
         Write-Host "ui_form.py updated." -ForegroundColor Blue
     }
     else
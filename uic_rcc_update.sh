@@ -22,7 +22,8 @@ if [ -f "$UiPath" ]; then
     echo -n "form.ui Newer than ui_form.py : "
     if [ "$lastSaveDateUI" -gt "$lastSaveDateUiPy" ]; then
         echo -e "\e[32mtrue\e[0m"
-        pyside6-uic form.ui -o ui_form.py
+        pyside6-uic --no-autoconnection form.ui -o ui_form.py
+        python3 strip_ui_noops.py ui_form.py
         echo -e "\e[34mui_form.py updated.\e[0m"
     else
         echo -e "\e[31mfalse\e[0m"